@@ -47,8 +47,11 @@ the commit claims to fix. This can be done by launching the script with:
 `bug_fixes_per_major_release.py -o`
 
 The script will then ask for the commit hash, then the
-issue number that commit actually fixes then will use that override
-(and all other overrides you've setup) when you run the script again.
+issue number that commit actually fixes. It keeps asking for more
+overrides until you leave the commit hash empty (or end the input with
+Ctrl-D), then stores them all and will use them (and all other overrides
+you've setup) when you run the script again.
+Overrides entered before interrupting the script with Ctrl-C are not stored.
 
 ---
 
@@ -56,9 +59,9 @@ issue number that commit actually fixes then will use that override
 - First the script gathers all commits that contain `Fix #NUMBER` that
 occured between the two versions of Blender you're interested in.
   - This is done using:
-  `git --no-pager log PREVIOUS_VERSION..CURRENT_VERSION --oneline -i -P --grep "Fix.*#+\d+"`
+  `git --no-pager log PREVIOUS_VERSION..CURRENT_VERSION -z --format=%H%x1f%s%x1f%B -i -P --grep "Fix.*#+\d+"`
 - The script then extracts all report numbers (`#NUMBER`)
-  from the commit message.
+  from the commit message (which is included in the output of the command above).
 - The script then iterates through those reports, checking the
   "Broken" and "Working" fields to try and figure out whether
   the commit fixed a issue that existed in earlier versions of Blender
@@ -162,17 +165,29 @@ __all__ = (
     "main",
 )
 
+import os
 import re
 import sys
 import json
 import subprocess
 import argparse
-import urllib.error
+import gzip
+import base64
+import math
+import hashlib
+import threading
+import email.utils
+import http.client
+import urllib.parse
 import urllib.request
 
 from time import time, sleep
-from typing import Any
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, TextIO
+from collections.abc import Iterator
 from pathlib import Path
+from http import HTTPStatus
 
 
 # -----------------------------------------------------------------------------
@@ -189,14 +204,56 @@ IGNORED = "IGNORED"
 
 SORTED_CLASSIFICATIONS = [FIXED_NEW_ISSUE, FIXED_OLD_ISSUE, IGNORED]
 VALID_CLASSIFICATIONS = [FIXED_NEW_ISSUE, NEEDS_MANUAL_SORTING, FIXED_OLD_ISSUE, FIXED_PR, REVERT, IGNORED]
+# Commits with these classifications are not stored in the commit cache.
+CACHE_SKIPPED_CLASSIFICATIONS = frozenset((NEEDS_MANUAL_SORTING, IGNORED))
 
-OLDER_VERION = "OLDER"
-NEWER_VERION = "NEWER"
-SAME_VERION = "SAME"
+# Printed after the release notes.
+RELEASE_NOTES_INSTRUCTIONS = """What to do with this output:
+    - Go through every commit in the "Commits that need manual sorting" section and:
+      - Find the corrisponding issue that was fixed (it will be in the commit message)
+      - Update the "Broken" and/or "Working" fields of the report with relevant information so this script can sort it.
+        - Add a module label if it's missing one.
+      - Rerun this script.
+    - Repeat the previous steps until there are no commits that need manual sorting.
+    - If it is too difficult to track down the broken or working field for a report, then you can add
+    `<!-- skip_for_bug_fix_release_notes -->` to the report body and the script will ignore it on subsequent runs.
+    - This should be done by the triaging module through out the release cycle, so the list should be quite small.
+
+    - Go through the "Revert commits" section and if needed,
+      find the commit they reverted and remove them from the list of "Commits that fixed old issues"
+      (This can be done manually or with the overrides feature).
+    - Double check if there are any obvious commits in the
+      "Commits that fixed old issues" section that shouldn't be there and remove them
+      (E.g. A fix for a feature that has been in development over a few releases,
+      but was only enabled in this release).
+    - Add the output of the "Commits that fixed old issues" section to the release notes:
+      https://projects.blender.org/blender/blender-developer-docs/src/branch/main/docs/release_notes
+      Here is the release notes for a previous release for reference:
+      https://projects.blender.org/blender/blender-developer-docs/src/branch/main/docs/release_notes/4.3/bugfixes.md
+"""
+
+# Prefix of the labels used for modules on Gitea.
+MODULE_LABEL_PREFIX = "Module/"
+
+# Number of reports requested at once when listing reports from Gitea.
+REPORTS_PER_PAGE = 50
+
+# Responses that redirect to another URL, see `url_response_get`.
+HTTP_REDIRECT_STATUSES = frozenset((
+    HTTPStatus.MOVED_PERMANENTLY,
+    HTTPStatus.FOUND,
+    HTTPStatus.SEE_OTHER,
+    HTTPStatus.TEMPORARY_REDIRECT,
+    HTTPStatus.PERMANENT_REDIRECT,
+))
+
+# Number of threads used to query Gitea while classifying commits.
+CLASSIFY_THREADS = 8
 
 dir_of_script = Path(__file__).parent.resolve()
 PATH_TO_OVERRIDES = dir_of_script.joinpath('overrides.json')
 PATH_TO_CACHED_COMMITS = dir_of_script.joinpath('cached_commits.json')
+PATH_TO_CACHED_REPORTS = dir_of_script.joinpath('cached_reports.json')
 del dir_of_script
 
 # Add recent Blender versions to this list, including in-development versions.
@@ -234,6 +291,45 @@ LIST_OF_OFFICIAL_BLENDER_VERSIONS = (
 # Catch duplicates
 assert len(set(LIST_OF_OFFICIAL_BLENDER_VERSIONS)) == len(LIST_OF_OFFICIAL_BLENDER_VERSIONS)
 
+# The (major, minor) numbers of each official version, so versions don't need to be parsed for every comparison.
+OFFICIAL_BLENDER_VERSION_NUMBERS = {
+    version: (int(version.split(".")[0]), int(version.split(".")[1]))
+    for version in LIST_OF_OFFICIAL_BLENDER_VERSIONS
+}
+
+
+def re_official_versions_create() -> re.Pattern[str]:
+    # Creates a regular expression that only matches official versions, so no other numbers need to be filtered out.
+    # Versions are grouped by their major version (E.g. `4\.(?:0|1|2)`), so the regular expression doesn't
+    # need to try every version at every position.
+    minor_versions_by_major: dict[str, list[str]] = {}
+    for version in LIST_OF_OFFICIAL_BLENDER_VERSIONS:
+        major, minor = version.split(".")
+        try:
+            minor_versions_by_major[major].append(minor)
+        except KeyError:
+            minor_versions_by_major[major] = [minor]
+
+    versions = "|".join(
+        f"{major}\\.(?:{'|'.join(minor_versions)})" for major, minor_versions in minor_versions_by_major.items()
+    )
+    # Skip versions that are part of a longer number (such as a date like `2024.3.1`).
+    return re.compile(rf'(?<!\d)(?<!\d\.)({versions})(?!\d)')
+
+
+# Every instance of #NUMBER in a commit message. These are the reports that the commit claims to fix.
+RE_FIXED_REPORT = re.compile(r'#(\d+)')
+# Official Blender versions in the format of `major.minor`.
+RE_VERSION_NUMBER = re_official_versions_create()
+# Lines in a report that start with "Broken" or "Working" (in any case).
+# Use `brok` to be able to detect different variations of "broken".
+# Use `work` to be able to detect both "worked" and "working".
+RE_REPORT_VERSION_LINE = re.compile(r'^(brok|work)[^\r\n]*', re.IGNORECASE | re.MULTILINE)
+# Reports containing this text are ignored (searched without making a lower case copy of the report).
+RE_SKIP_REPORT = re.compile(r'skip_for_bug_fix_release_notes', re.IGNORECASE)
+# Commits listed in backport tasks (the whole reference must be hexadecimal, so other references are skipped).
+RE_BACKPORTED_COMMIT = re.compile(r'blender/blender@([a-fA-F0-9]+)\b')
+
 
 # -----------------------------------------------------------------------------
 # Private Utilities
@@ -241,29 +337,217 @@ assert len(set(LIST_OF_OFFICIAL_BLENDER_VERSIONS)) == len(LIST_OF_OFFICIAL_BLEND
 # Conform to Blenders crawl delay request:
 # https://projects.blender.org/robots.txt
 crawl_delay = 2
-last_checked_time = None
+# Requests may be made from multiple threads, each request reserves the next time it's allowed to run.
+next_request_time = 0.0
+next_request_time_lock = threading.Lock()
+
+# Used to store a connection to Gitea (and the host it connects to) for each thread, see `https_connection_get`.
+connection_per_thread = threading.local()
+
+# Information used from reports, keyed by the report number, see `report_information_get`.
+cached_reports: dict[str, dict[str, Any]] = {}
+# Reports in `cached_reports` that are known to be up to date in this run, these aren't requested again.
+up_to_date_reports: set[str] = set()
+# The date (according to Gitea) of the first response in this run.
+# Reports checked in this run are up to date as of this date, see `cached_reports_refresh`.
+first_response_date: str | None = None
+
+
+def crawl_delay_wait() -> None:
+    global next_request_time
+
+    with next_request_time_lock:
+        current_time = time()
+        request_time = max(next_request_time, current_time)
+        next_request_time = request_time + crawl_delay
+
+    sleep(request_time - current_time)
+
+
+def https_connection_create(host: str) -> http.client.HTTPSConnection:
+    # Use the proxy from the environment (`https_proxy` etc.) like `urllib.request` does.
+    proxy = urllib.request.getproxies().get("https")
+    if (not proxy) or urllib.request.proxy_bypass(host):
+        return http.client.HTTPSConnection(host, timeout=60)
+
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    proxy_split = urllib.parse.urlsplit(proxy)
+
+    # Connect to the proxy and tunnel the TLS connection to the host through it.
+    tunnel_headers = {}
+    if proxy_split.username is not None:
+        credentials = f"{urllib.parse.unquote(proxy_split.username)}:{urllib.parse.unquote(proxy_split.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+
+    connection = http.client.HTTPSConnection(proxy_split.hostname, proxy_split.port, timeout=60)
+    connection.set_tunnel(host, headers=tunnel_headers)
+    return connection
+
+
+def https_connection_get(host: str, *, reconnect: bool) -> http.client.HTTPSConnection:
+    # Connections are kept open between requests (avoiding a new TCP & TLS handshake for every request).
+    # A connection can't be shared between threads, so each thread has its own.
+    connection = getattr(connection_per_thread, "connection", None)
+    if reconnect or (connection is None) or (connection_per_thread.host != host):
+        if connection is not None:
+            connection.close()
+        connection = https_connection_create(host)
+        connection_per_thread.connection = connection
+        connection_per_thread.host = host
+    return connection
+
+
+def url_response_get(
+        url: str,
+        headers: dict[str, str],
+        *,
+        redirects_remaining: int = 10,
+) -> tuple[int, http.client.HTTPMessage, bytes] | None:
+    # Returns the status, headers and content of the response.
+    global first_response_date
+
+    crawl_delay_wait()
+
+    url_split = urllib.parse.urlsplit(url)
+    path = f"{url_split.path}?{url_split.query}" if url_split.query else url_split.path
+    # Responses (particularly long report descriptions) compress well.
+    headers = {"Accept-Encoding": "gzip", **headers}
+
+    for attempt in range(2):
+        # The server can close a connection that was kept open, in that case retry once with a new connection.
+        connection = https_connection_get(url_split.netloc, reconnect=attempt > 0)
+        try:
+            # Make the HTTP request and store the response in a 'response' object
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            result_bytes = response.read()
+            break
+        except (http.client.HTTPException, OSError) as ex:
+            if attempt > 0:
+                connection.close()
+                print(url)
+                print(f"Error making HTTP request: {ex}")
+                return None
+
+    if first_response_date is None:
+        first_response_date = response.headers.get("Date")
+
+    if response.status == HTTPStatus.NOT_MODIFIED:
+        # Only returned for conditional requests, the caller already has the content.
+        return response.status, response.headers, b""
+    if (response.status in HTTP_REDIRECT_STATUSES) and (redirects_remaining > 0):
+        # Follow redirects like `urllib.request` does (only to HTTPS, as that's all connections support).
+        location = response.headers.get("Location")
+        if location is not None:
+            url_redirect = urllib.parse.urljoin(url, location)
+            if urllib.parse.urlsplit(url_redirect).scheme == "https":
+                return url_response_get(url_redirect, headers, redirects_remaining=redirects_remaining - 1)
+    if response.status != HTTPStatus.OK:
+        print(url)
+        print(f"Error making HTTP request: HTTP Error {response.status}: {response.reason}")
+        return None
 
+    if response.headers.get("Content-Encoding") == "gzip":
+        result_bytes = gzip.decompress(result_bytes)
+
+    return response.status, response.headers, result_bytes
+
+
+def report_information_create(
+        report: dict[str, Any],
+        response_headers: http.client.HTTPMessage | None,
+) -> dict[str, Any]:
+    # Only keep the information this script uses from a report.
+    return {
+        'title': report['title'],
+        'labels': [{'name': label['name']} for label in report['labels']],
+        'html_url': report['html_url'],
+        'body': report['body'],
+        'etag': response_headers.get('ETag') if response_headers else None,
+        'last_modified': response_headers.get('Last-Modified') if response_headers else None,
+    }
+
+
+def report_information_get(report_number: str) -> dict[str, Any] | None:
+    # Returns the information this script uses from a report, reusing the cached report when it's unchanged.
+    if report_number in up_to_date_reports:
+        return cached_reports[report_number]
+
+    url = f"https://projects.blender.org/api/v1/repos/blender/blender/issues/{report_number}"
+
+    cached_report = cached_reports.get(report_number)
+    headers = {}
+    if cached_report is not None:
+        # Ask Gitea to only send the report if it changed since it was cached.
+        if cached_report['etag']:
+            headers['If-None-Match'] = cached_report['etag']
+        if cached_report['last_modified']:
+            headers['If-Modified-Since'] = cached_report['last_modified']
+
+    response = url_response_get(url, headers)
+    if response is None:
+        return None
 
-def url_json_get(url: str) -> Any:
-    global last_checked_time
+    status, response_headers, result_bytes = response
+    if status == HTTPStatus.NOT_MODIFIED:
+        assert cached_report is not None
+        up_to_date_reports.add(report_number)
+        return cached_report
 
-    if last_checked_time is not None:
-        sleep(max(crawl_delay - (time() - last_checked_time), 0))
-    last_checked_time = time()
+    # Convert the response content to a JSON object containing the report information.
+    report = json.loads(result_bytes)
+    assert isinstance(report, dict)
+    report_information = report_information_create(report, response_headers)
+    cached_reports[report_number] = report_information
+    up_to_date_reports.add(report_number)
+    return report_information
 
-    try:
-        # Make the HTTP request and store the response in a 'response' object
-        with urllib.request.urlopen(url) as response:
-            result_bytes = response.read()
-    except urllib.error.URLError as ex:
-        print(url)
-        print(f"Error making HTTP request: {ex}")
-        return None
 
-    # Convert the response content to a JSON object containing the user information.
-    result = json.loads(result_bytes)
-    assert result is None or isinstance(result, (dict, list))
-    return result
+def stream_split(stream: TextIO, separator: str) -> Iterator[str]:
+    # Yield every record terminated by `separator` from `stream`, without reading the whole stream at once.
+    # Any text after the last separator is not a complete record and is discarded.
+    remainder = ""
+    while chunk := stream.read(1 << 16):
+        records = (remainder + chunk).split(separator)
+        remainder = records.pop()
+        yield from records
+
+
+# -----------------------------------------------------------------------------
+# Back-port Index Class
+
+class BackportIndex:
+    # Look up which versions a commit was back-ported to, without comparing it against every back-ported commit.
+    __slots__ = (
+        "prefix_length",
+        "backports_by_prefix",
+    )
+
+    def __init__(self, dict_of_backports: dict[str, list[str]]) -> None:
+        # Back-ported commits may use shortened hashes of different lengths.
+        # Index them by the length of the shortest one, so any full hash can be looked up by its prefix.
+        self.prefix_length = min(
+            (len(backported_commit) for backports in dict_of_backports.values() for backported_commit in backports),
+            default=0,
+        )
+
+        self.backports_by_prefix: dict[str, list[tuple[str, str]]] = {}
+        for version_number, backports in dict_of_backports.items():
+            for backported_commit in backports:
+                prefix = backported_commit[:self.prefix_length]
+                try:
+                    self.backports_by_prefix[prefix].append((backported_commit, version_number))
+                except KeyError:
+                    self.backports_by_prefix[prefix] = [(backported_commit, version_number)]
+
+    def versions_get(self, commit_hash: str) -> list[str]:
+        versions: list[str] = []
+        # Only the (few) back-ported commits that share a prefix with this commit need to be compared.
+        for backported_commit, version_number in self.backports_by_prefix.get(commit_hash[:self.prefix_length], ()):
+            if commit_hash.startswith(backported_commit) and version_number not in versions:
+                versions.append(version_number)
+        return versions
 
 
 # -----------------------------------------------------------------------------
@@ -277,7 +561,6 @@ class CommitInfo:
         "backport_list",
         "classification",
         "fixed_reports",
-        "fixed_reports",
         "has_been_overwritten",
         "is_revert",
         "module",
@@ -285,21 +568,28 @@ class CommitInfo:
         "report_title",
     )
 
-    def __init__(self, commit_line: str) -> None:
-        split_message = commit_line.split()
+    # Attributes stored in the cache (keyed by the commit hash).
+    cached_attributes = (
+        "is_revert",
+        "fixed_reports",
+        "backport_list",
+        "module",
+        "report_title",
+        "classification",
+    )
 
-        # Commit line is in the format:
-        # COMMIT_HASH Title of commit
-        self.hash = split_message[0]
-        self.commit_title = " ".join(split_message[1:])
+    def __init__(self, commit_hash: str, commit_title: str, commit_message: str) -> None:
+        self.hash = commit_hash
+        self.commit_title = commit_title
 
         self.set_defaults()
 
+        self.fixed_reports = RE_FIXED_REPORT.findall(commit_message)
+
     def set_defaults(self) -> None:
         self.is_revert = 'revert' in self.commit_title.lower()
 
         self.fixed_reports: list[str] = []
-        self.check_full_commit_message_for_fixed_reports()
 
         # Setup some "useful" empty defaults.
         self.backport_list: list[str] = []
@@ -311,23 +601,10 @@ class CommitInfo:
         self.needs_update = True
         self.has_been_overwritten = False
 
-    def check_full_commit_message_for_fixed_reports(self) -> None:
-        command = ['git', 'show', '-s', '--format=%B', self.hash]
-        command_output = subprocess.run(command, capture_output=True).stdout.decode('utf-8')
-
-        # Find every instance of #NUMBER. These are the report that the commit claims to fix.
-        match = re.findall(r'#(\d+)', command_output)
-        if match:
-            self.fixed_reports = match
-
-    def get_backports(self, dict_of_backports: dict[str, list[str]]) -> None:
+    def get_backports(self, backport_index: BackportIndex) -> None:
         # Figures out if the commit was back-ported, and to what version(s).
         if self.needs_update:
-            for version_number in dict_of_backports:
-                for backported_commit in dict_of_backports[version_number]:
-                    if self.hash.startswith(backported_commit):
-                        self.backport_list.append(version_number)
-                        break
+            self.backport_list += backport_index.versions_get(self.hash)
 
         if len(self.backport_list) > 0:
             # If the fix was back-ported to a old release, then it fixed a old issue.
@@ -356,9 +633,10 @@ class CommitInfo:
     def get_module(self, labels: list[dict[Any, Any]]) -> str:
         # Figures out what module the report that was fixed belongs too.
         for label in labels:
-            if "module" in label['name'].lower():
-                # Module labels are typically in the format Module/NAME.
-                return " ".join(label['name'].split("/")[1:])
+            label_name = label['name']
+            if label_name.startswith(MODULE_LABEL_PREFIX):
+                # Module labels are in the format Module/NAME.
+                return label_name[len(MODULE_LABEL_PREFIX):].replace("/", " ")
 
         return UNKNOWN
 
@@ -379,8 +657,7 @@ class CommitInfo:
             return
 
         for report_number in self.fixed_reports:
-            report_information = url_json_get(
-                f"https://projects.blender.org/api/v1/repos/blender/blender/issues/{report_number}")
+            report_information = report_information_get(report_number)
 
             report_title = report_information['title']
             module = self.get_module(report_information['labels'])
@@ -422,22 +699,11 @@ class CommitInfo:
         return formatted_string
 
     def prepare_for_cache(self) -> tuple[str, dict[str, Any]]:
-        return self.hash, {
-            'is_revert': self.is_revert,
-            'fixed_reports': self.fixed_reports,
-            'backport_list': self.backport_list,
-            'module': self.module,
-            'report_title': self.report_title,
-            'classification': self.classification,
-        }
+        return self.hash, {attribute: getattr(self, attribute) for attribute in self.cached_attributes}
 
     def read_from_cache(self, cache_data: dict[str, Any]) -> None:
-        self.is_revert = cache_data['is_revert']
-        self.fixed_reports = cache_data['fixed_reports']
-        self.backport_list = cache_data['backport_list']
-        self.module = cache_data['module']
-        self.report_title = cache_data['report_title']
-        self.classification = cache_data['classification']
+        for attribute in self.cached_attributes:
+            setattr(self, attribute, cache_data[attribute])
 
         self.needs_update = False
 
@@ -450,8 +716,19 @@ class CommitInfo:
 # ---
 
 
-def setup_commit_info(commit: str) -> CommitInfo | None:
-    commit_information = CommitInfo(commit)
+def setup_commit_info(commit_record: str, cached_commits: dict[str, dict[str, Any]]) -> CommitInfo | None:
+    # Commit record is in the format (with fields separated by a unit separator character):
+    # COMMIT_HASH, Title of commit, Full commit message (including the title)
+    commit_hash, commit_title, commit_message = commit_record.split("\x1f", 2)
+
+    cache_data = cached_commits.get(commit_hash)
+    if cache_data is not None:
+        # The fixed reports are stored in the cache, there is no need to search the commit message for them.
+        commit_information = CommitInfo(commit_hash, commit_title, "")
+        commit_information.read_from_cache(cache_data)
+        return commit_information
+
+    commit_information = CommitInfo(commit_hash, commit_title, commit_message)
     if len(commit_information.fixed_reports) > 0:
         return commit_information
     return None
@@ -461,10 +738,15 @@ def get_fix_commits(
         *,
         current_release_tag: str,
         previous_release_tag: str,
-        single_thread: bool,
+        cached_commits: dict[str, dict[str, Any]],
 ) -> list[CommitInfo]:
     # --no-pager means it prints everything all at once rather than providing a interactive scrollable page.
     # --no-abbrev-commit tells git to always show the full commit hash.
+    # --no-show-signature skips verifying signed commits (when enabled in the users git configuration),
+    #   which is slow and adds output this script doesn't read.
+    # -z terminates each commit with a NUL character (the full message can span multiple lines).
+    # --format requests the hash, title and full message of every commit in a single call,
+    #   separated by a unit separator character (%x1f), which doesn't appear in commit messages.
     # -i tells grep to ignore case when searching through commits.
     # -P tells grep to use a specific type of regular expression.
 
@@ -478,97 +760,64 @@ def get_fix_commits(
         '--no-pager',
         'log',
         f'{previous_release_tag}..{current_release_tag}',
-        '--oneline',
         '--no-abbrev-commit',
+        '--no-show-signature',
+        '-z',
+        '--format=%H%x1f%s%x1f%B',
         '-i',
         '-P',
         '--grep',
         r'Fix.*#+\d+',
     ]
 
-    git_log_command_output = subprocess.run(command, capture_output=True).stdout.decode('utf-8')
-    git_log_output = git_log_command_output.splitlines()
-
-    if single_thread:
-        # Original non-multiprocessing method.
-        intial_list_of_commits = []
-        for commit in git_log_output:
-            intial_list_of_commits.append(setup_commit_info(commit))
-    else:
-        # Although setup_commit_info is not compute intensive, it is time consuming due to hundreds of git log calls.
-        # Multiprocessing can significantly reduce the time taken (E.g. 19s -> 4s on a 32 thread CPU).
-        import multiprocessing
-        with multiprocessing.Pool() as pool:
-            intial_list_of_commits = pool.map(setup_commit_info, git_log_output)
-
-    list_of_commits = [result for result in intial_list_of_commits if result]
+    list_of_commits = []
+    # Read the output while git is still writing it, rather than waiting for (and storing) all of it.
+    with subprocess.Popen(command, stdout=subprocess.PIPE, encoding='utf-8') as process:
+        assert process.stdout is not None
+        for commit_record in stream_split(process.stdout, "\0"):
+            commit_information = setup_commit_info(commit_record, cached_commits)
+            if commit_information is not None:
+                list_of_commits.append(commit_information)
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
     return list_of_commits
 
 
 # -----------------------------------------------------------------------------
 # Utility Functions for `classify_based_on_report()`
 
-def get_version_numbers(broken_lines: str, working_lines: str) -> tuple[list[str], list[str]]:
-    def extract_numbers(string: str) -> list[str]:
-        return re.findall(r"(\d+\.\d+)", string)
-
-    # Extracts all version numbers from the broken and working fields
-    # (Sometimes including weird version numbers like dates).
-    temp_broken_versions = extract_numbers(broken_lines)
-    temp_working_versions = extract_numbers(working_lines)
+def get_version_numbers(line: str) -> list[str]:
+    # Extracts all official Blender version numbers from a broken or working field.
+    return RE_VERSION_NUMBER.findall(line)
 
-    broken_versions = []
-    working_versions = []
 
-    for version_number in temp_broken_versions:
-        # Filter out any numbers picked up in the previous step that aren't official Blender version numbers.
-        if version_number in LIST_OF_OFFICIAL_BLENDER_VERSIONS:
-            broken_versions.append(version_number)
-    for version_number in temp_working_versions:
-        # Filter out any numbers picked up in the previous step that aren't official Blender version numbers.
-        if version_number in LIST_OF_OFFICIAL_BLENDER_VERSIONS:
-            working_versions.append(version_number)
+def version_extraction(report_body: str) -> tuple[list[str], list[str]]:
+    broken_versions: list[str] = []
+    working_versions: list[str] = []
+    # Only the "Broken" and "Working" lines are visited, rather than every line of the report.
+    # Version numbers are extracted from each line directly, rather than joining the lines to search them again.
+    for match in RE_REPORT_VERSION_LINE.finditer(report_body):
+        line = match.group(0)
+        if 'example' in line.lower():
+            continue
+        if match.group(1).lower() == 'brok':
+            broken_versions += get_version_numbers(line)
+        else:
+            working_versions += get_version_numbers(line)
 
     return broken_versions, working_versions
 
 
-def version_extraction(report_body: str) -> tuple[list[str], list[str]]:
-    broken_lines = ''
-    working_lines = ''
-    for line in report_body.splitlines():
-        lower_line = line.lower()
-        example_in_line = 'example' in lower_line
-        if lower_line.startswith('brok') and not example_in_line:
-            # Use `brok` to be able to detect different variations of "broken".
-            broken_lines += f'{line}\n'
-        if lower_line.startswith('work'):
-            # Use `work` to be able to detect both "worked" and "working".
-            if not example_in_line:
-                working_lines += f'{line}\n'
-
-    return get_version_numbers(broken_lines, working_lines)
-
-
-def compare_versions(comparing_version: str, reference_version: str) -> str:
-    # Compare two versions of Blender and return how they compare relative to each other.
-    comp_version = comparing_version.split(".")
-    ref_version = reference_version.split(".")
-    comparing_major = int(comp_version[0])
-    comparing_minor = int(comp_version[1])
-    reference_major = int(ref_version[0])
-    reference_minor = int(ref_version[1])
-
-    if comparing_major < reference_major:
-        return OLDER_VERION
-
-    if comparing_major == reference_major:
-        # The major version matches, so we must compare based on the minor version number.
-        if comparing_minor < reference_minor:
-            return OLDER_VERION
-        if comparing_minor == reference_minor:
-            return SAME_VERION
-
-    return NEWER_VERION
+def version_numbers(version: str) -> tuple[int, int]:
+    # Returns the (major, minor) numbers of a version.
+    try:
+        return OFFICIAL_BLENDER_VERSION_NUMBERS[version]
+    except KeyError:
+        # Not an official version (yet), this can happen for the current version passed in as an argument.
+        split_version = version.split(".")
+        return int(split_version[0]), int(split_version[1])
 
 
 # ---
@@ -579,28 +828,24 @@ def classify_based_on_report(
         current_version: str,
         previous_version: str,
 ) -> str:
-    if "skip_for_bug_fix_release_notes" in report_body.lower():
+    if RE_SKIP_REPORT.search(report_body):
         return IGNORED
     # Get a list of broken and working versions of Blender according to the report that was fixed.
     broken_versions, working_versions = version_extraction(report_body)
 
-    broken_is_current_or_newer = False
+    # Tuples compare based on the major version, then the minor version.
+    current_version_numbers = version_numbers(current_version)
 
-    for broken_version in broken_versions:
-        relative_version = compare_versions(broken_version, current_version)
-        if relative_version == OLDER_VERION:
-            # Broken version is older than current release. So the issue is from a older version.
-            return FIXED_OLD_ISSUE
-        if relative_version in (SAME_VERION, NEWER_VERION):
-            broken_is_current_or_newer = True
+    if any(version_numbers(broken_version) < current_version_numbers for broken_version in broken_versions):
+        # Broken version is older than current release. So the issue is from a older version.
+        return FIXED_OLD_ISSUE
 
-    for working_version in working_versions:
-        relative_version = compare_versions(working_version, current_version)
-        if relative_version in (SAME_VERION, NEWER_VERION):
-            # Working version is current version or newer. So the issue was introduced in this version.
-            return FIXED_NEW_ISSUE
+    if any(version_numbers(working_version) >= current_version_numbers for working_version in working_versions):
+        # Working version is current version or newer. So the issue was introduced in this version.
+        return FIXED_NEW_ISSUE
 
-    if broken_is_current_or_newer and (previous_version in working_versions):
+    # At this point all broken versions are the current version or newer.
+    if broken_versions and (previous_version in working_versions):
         # Issue is in current release, but wasn't in previous release.
         # So it must of been introduced in the current release.
         return FIXED_NEW_ISSUE
@@ -614,10 +859,7 @@ def classify_based_on_report(
 def get_backported_commits(issue_number: str) -> dict[str, list[str]]:
     # Adapted from https://projects.blender.org/blender/blender/src/branch/main/release/lts/lts_issue.py
 
-    base_url = "https://projects.blender.org/api/v1/repos"
-    issues_url = base_url + "/blender/blender/issues/"
-
-    response = url_json_get(issues_url + issue_number)
+    response = report_information_get(issue_number)
     description = response["body"]
 
     lines = description.split("\n")
@@ -648,8 +890,7 @@ def get_backported_commits(issue_number: str) -> dict[str, list[str]]:
         commit_string = commit_string.split("]")[0]
         commit_string = commit_string.replace("[", "")
 
-        pattern = r"blender/blender@([a-zA-Z0-9]+)"
-        matches = re.findall(pattern, commit_string)
+        matches = RE_BACKPORTED_COMMIT.findall(commit_string)
         if len(matches) > 0:
             try:
                 dict_of_backports[current_version] += matches
@@ -659,12 +900,13 @@ def get_backported_commits(issue_number: str) -> dict[str, list[str]]:
     return dict_of_backports
 
 
-def get_backports(backport_tasks: list[str]) -> dict[str, list[str]]:
+def get_backports(backport_tasks: list[str]) -> BackportIndex:
     dict_of_backports: dict[str, list[str]] = {}
     for task in backport_tasks:
         dict_of_backports.update(get_backported_commits(task))
 
-    return dict_of_backports
+    # Index the back-ported commits once, rather than searching all of them for every commit.
+    return BackportIndex(dict_of_backports)
 
 
 # ---
@@ -675,31 +917,52 @@ def classify_commits(
         *,
         current_version: str,
         previous_version: str,
+        single_thread: bool,
 ) -> None:
     number_of_commits = len(list_of_commits)
 
     print("Identifying if fixes are for a bug introduced in this release, or if the bug was there in a previous release.")
     print("This requires querying information from Gitea, and can take a while.\n")
 
-    dict_of_backports = get_backports(backport_tasks)
-
-    i = 0
-    start_time = time()
-    for commit in list_of_commits:
-        # Simple progress bar.
-        i += 1
-        print(
-            f"{i}/{number_of_commits} - Estimated time remaining:",
-            f"{(((time() - start_time) / i) * (number_of_commits - i)) / 60:.1f} minutes",
-            end="\r",
-            flush=True
-        )
+    backport_index = get_backports(backport_tasks)
 
+    def commit_classify(commit: CommitInfo) -> None:
         commit.classify(
             current_version=current_version,
             previous_version=previous_version,
         )
-        commit.get_backports(dict_of_backports)
+        commit.get_backports(backport_index)
+
+    # Classifying is spent waiting on Gitea, using multiple threads means the wait for a response
+    # overlaps with other requests (the crawl delay between requests is still respected).
+    with ThreadPoolExecutor(max_workers=1 if single_thread else CLASSIFY_THREADS) as executor:
+        futures = [executor.submit(commit_classify, commit) for commit in list_of_commits]
+
+        i = 0
+        start_time = time()
+        last_print_time = 0.0
+        try:
+            for future in as_completed(futures):
+                # Raise any exceptions from the thread.
+                future.result()
+
+                # Simple progress bar.
+                # Only update it a few times a second, as printing is slower than classifying cached commits.
+                i += 1
+                current_time = time()
+                if (current_time - last_print_time >= 0.25) or (i == number_of_commits):
+                    last_print_time = current_time
+                    print(
+                        f"{i}/{number_of_commits} - Estimated time remaining:",
+                        f"{(((current_time - start_time) / i) * (number_of_commits - i)) / 60:.1f} minutes",
+                        end="\r",
+                        flush=True
+                    )
+        except BaseException:
+            # On an error (or when interrupted with Ctrl-C), don't wait for the remaining commits to be classified,
+            # only for the ones already being classified.
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
 
     # Print so we're away from the progress bar.
     print("\n\n\n")
@@ -715,14 +978,15 @@ def prepare_for_print(list_of_commits: list[CommitInfo]) -> dict[str, dict[str,
         dict_of_sorted_commits[item] = {}
 
     for commit in list_of_commits:
-        commit_classification = commit.classification
-        if commit_classification in VALID_CLASSIFICATIONS:
+        # Look up the classification in the dictionary, instead of searching `VALID_CLASSIFICATIONS` for it.
+        commits_by_module = dict_of_sorted_commits.get(commit.classification)
+        if commits_by_module is not None:
             commit_module = commit.module
             try:
                 # Try to append to a list. If it fails (The list doesn't exist), create the list.
-                dict_of_sorted_commits[commit_classification][commit_module].append(commit)
+                commits_by_module[commit_module].append(commit)
             except KeyError:
-                dict_of_sorted_commits[commit_classification][commit_module] = [commit]
+                commits_by_module[commit_module] = [commit]
 
     for item in VALID_CLASSIFICATIONS:
         # Sort modules alphabetically
@@ -731,33 +995,27 @@ def prepare_for_print(list_of_commits: list[CommitInfo]) -> dict[str, dict[str,
     return dict_of_sorted_commits
 
 
-def print_list_of_commits(title: str, dict_of_commits: dict[str, list[CommitInfo]]) -> None:
-    commits_message = ""
+def format_list_of_commits(title: str, dict_of_commits: dict[str, list[CommitInfo]]) -> str:
+    # Returns the section of the release notes for these commits, an empty string when there are none.
+    commits_message: list[str] = []
     number_of_commits = 0
-    unknown_module_commit_message = ""
-    for module in dict_of_commits:
-        commits_in_this_module = len(dict_of_commits[module])
+    unknown_module_commit_message: list[str] = []
+    for module, commits in dict_of_commits.items():
+        commits_in_this_module = len(commits)
         number_of_commits += commits_in_this_module
-        module_label = f"\n## {module}: {commits_in_this_module}\n"
-        module_is_unknown = (module == UNKNOWN)
-        if module_is_unknown:
-            unknown_module_commit_message += module_label
-        else:
-            commits_message += module_label
-
-        for commit in dict_of_commits[module]:
-            printed_line = commit.generate_release_note_ready_string()
+        message = unknown_module_commit_message if (module == UNKNOWN) else commits_message
+        message.append(f"\n## {module}: {commits_in_this_module}\n")
+        message.extend(commit.generate_release_note_ready_string() for commit in commits)
 
-            if module_is_unknown:
-                unknown_module_commit_message += printed_line
-            else:
-                commits_message += printed_line
+    if number_of_commits == 0:
+        return ""
 
-    if number_of_commits != 0:
-        print(f"{title} {number_of_commits}")
-        print(commits_message)
-        print(unknown_module_commit_message)
-        print("\n\n\n")
+    return "".join((
+        f"{title} {number_of_commits}\n",
+        *commits_message, "\n",
+        *unknown_module_commit_message, "\n",
+        "\n\n\n\n",
+    ))
 
 
 # ---
@@ -765,55 +1023,72 @@ def print_list_of_commits(title: str, dict_of_commits: dict[str, list[CommitInfo
 def print_release_notes(list_of_commits: list[CommitInfo]) -> None:
     dict_of_sorted_commits = prepare_for_print(list_of_commits)
 
-    print_list_of_commits("Commits that fixed old issues:", dict_of_sorted_commits[FIXED_OLD_ISSUE])
+    # Write the release notes at once, instead of a line at a time.
+    release_notes = [
+        format_list_of_commits("Commits that fixed old issues:", dict_of_sorted_commits[FIXED_OLD_ISSUE]),
+        format_list_of_commits("Revert commits:", dict_of_sorted_commits[REVERT]),
+        format_list_of_commits("Commits that need manual sorting:", dict_of_sorted_commits[NEEDS_MANUAL_SORTING]),
+        format_list_of_commits(
+            "Commits that need a override (launch this script with -o) as they claim to fix a PR:",
+            dict_of_sorted_commits[FIXED_PR]),
+        format_list_of_commits("Ignored commits:", dict_of_sorted_commits[IGNORED]),
+    ]
 
-    print_list_of_commits("Revert commits:", dict_of_sorted_commits[REVERT])
+    # Currently disabled as this information isn't particularly useful.
+    # release_notes.append(format_list_of_commits(dict_of_sorted_commits[FIXED_NEW_ISSUE]))
 
-    print_list_of_commits("Commits that need manual sorting:", dict_of_sorted_commits[NEEDS_MANUAL_SORTING])
+    release_notes.append(RELEASE_NOTES_INSTRUCTIONS)
+    sys.stdout.write("".join(release_notes))
 
-    print_list_of_commits(
-        "Commits that need a override (launch this script with -o) as they claim to fix a PR:",
-        dict_of_sorted_commits[FIXED_PR])
 
-    print_list_of_commits("Ignored commits:", dict_of_sorted_commits[IGNORED])
+# -----------------------------------------------------------------------------
+# Caching Utilities
 
-    # Currently disabled as this information isn't particularly useful.
-    # print_list_of_commits(dict_of_sorted_commits[FIXED_NEW_ISSUE])
+# All cache and override files are read and written with these functions.
 
-    print(r"""What to do with this output:
-    - Go through every commit in the "Commits that need manual sorting" section and:
-      - Find the corrisponding issue that was fixed (it will be in the commit message)
-      - Update the "Broken" and/or "Working" fields of the report with relevant information so this script can sort it.
-        - Add a module label if it's missing one.
-      - Rerun this script.
-    - Repeat the previous steps until there are no commits that need manual sorting.
-    - If it is too difficult to track down the broken or working field for a report, then you can add
-    `<!-- skip_for_bug_fix_release_notes -->` to the report body and the script will ignore it on subsequent runs.
-    - This should be done by the triaging module through out the release cycle, so the list should be quite small.
+# Fingerprints of the contents of files when they were last read or written, see `json_file_store`.
+json_file_fingerprints: dict[Path, bytes] = {}
 
-    - Go through the "Revert commits" section and if needed,
-      find the commit they reverted and remove them from the list of "Commits that fixed old issues"
-      (This can be done manually or with the overrides feature).
-    - Double check if there are any obvious commits in the
-      "Commits that fixed old issues" section that shouldn't be there and remove them
-      (E.g. A fix for a feature that has been in development over a few releases,
-      but was only enabled in this release).
-    - Add the output of the "Commits that fixed old issues" section to the release notes:
-      https://projects.blender.org/blender/blender-developer-docs/src/branch/main/docs/release_notes
-      Here is the release notes for a previous release for reference:
-      https://projects.blender.org/blender/blender-developer-docs/src/branch/main/docs/release_notes/4.3/bugfixes.md""")
 
+def json_file_fingerprint(file_bytes: bytes) -> bytes:
+    return hashlib.blake2b(file_bytes, digest_size=16).digest()
 
-# -----------------------------------------------------------------------------
-# Caching Utilities
 
-def cached_commits_load(list_of_commits: list[CommitInfo]) -> None:
+def json_file_load(path: Path) -> Any:
+    # Read the whole file at once and let `json` decode it, instead of reading & decoding it in chunks.
+    file_bytes = path.read_bytes()
+    json_file_fingerprints[path] = json_file_fingerprint(file_bytes)
+    return json.loads(file_bytes)
+
+
+def json_file_store(path: Path, data: Any, *, indent: int | None = None) -> None:
+    # Write the whole file at once, instead of writing each piece of JSON as it's encoded.
+    # Files are only indented when they're intended to be read by people,
+    # as indenting is slower (`json` can't use its C encoder) and makes the file larger.
+    # For the same reason files that aren't indented don't use spaces after separators either.
+    separators = (",", ":") if indent is None else None
+    file_bytes = json.dumps(data, indent=indent, separators=separators).encode('utf-8')
+
+    fingerprint = json_file_fingerprint(file_bytes)
+    if json_file_fingerprints.get(path) == fingerprint:
+        # The file already contains this data (common when re-running with the cache), skip writing it.
+        return
+
+    # Write to a temporary file first and replace the file with it, so the file is never left partially written
+    # (when the script is interrupted for example), which would lose the whole cache.
+    path_temp = path.with_name(path.name + ".tmp")
+    path_temp.write_bytes(file_bytes)
+    os.replace(path_temp, path)
+    json_file_fingerprints[path] = fingerprint
+
+
+def cached_commits_load() -> dict[str, dict[str, Any]]:
+    # Returns the cached information of commits, keyed by the commit hash.
+    cached_data = {}
     if PATH_TO_CACHED_COMMITS.exists():
-        with open(str(PATH_TO_CACHED_COMMITS), 'r', encoding='utf-8') as file:
-            cached_data = json.load(file)
-        for commit in list_of_commits:
-            if commit.hash in cached_data:
-                commit.read_from_cache(cached_data[commit.hash])
+        cached_data = json_file_load(PATH_TO_CACHED_COMMITS)
+
+    return cached_data
 
 
 def cached_commits_store(list_of_commits: list[CommitInfo]) -> None:
@@ -822,14 +1097,128 @@ def cached_commits_store(list_of_commits: list[CommitInfo]) -> None:
     # This is done so if a user is repeatably running this script so they can sort
     # the "needs sorting" section, they don't have to wait for information requests to GITEA
     # on commits that are already sorted (and they're not interested in).
-    data_to_cache = {}
-    for commit in list_of_commits:
-        if (commit.classification not in (NEEDS_MANUAL_SORTING, IGNORED)) and not (commit.has_been_overwritten):
-            commit_hash, data = commit.prepare_for_cache()
-            data_to_cache[commit_hash] = data
+    data_to_cache = dict(
+        commit.prepare_for_cache()
+        for commit in list_of_commits
+        if (commit.classification not in CACHE_SKIPPED_CLASSIFICATIONS) and not commit.has_been_overwritten
+    )
+
+    json_file_store(PATH_TO_CACHED_COMMITS, data_to_cache)
 
-    with open(str(PATH_TO_CACHED_COMMITS), 'w', encoding='utf-8') as file:
-        json.dump(data_to_cache, file, indent=4)
+
+def cached_reports_load() -> str | None:
+    # Returns the date the cached reports were last checked with Gitea.
+    if PATH_TO_CACHED_REPORTS.exists():
+        cached_data = json_file_load(PATH_TO_CACHED_REPORTS)
+        cached_reports.update(cached_data['reports'])
+        return cached_data['checked_date']
+
+    return None
+
+
+def cached_reports_refresh(checked_date: str) -> None:
+    # Gitea can't return a list of specific reports in one request, so instead list all reports that changed
+    # since the cache was last checked. This typically takes a few requests, after which all cached reports
+    # are known to be up to date, rather than checking every cached report with a request of its own.
+    # Check from a bit earlier than the stored date, as it's from the first response of the previous run,
+    # other requests of that run may have been handled by Gitea slightly before it.
+    since = (email.utils.parsedate_to_datetime(checked_date) - timedelta(minutes=10)).isoformat()
+    url = (
+        "https://projects.blender.org/api/v1/repos/blender/blender/issues"
+        f"?state=all&limit={REPORTS_PER_PAGE}&since={urllib.parse.quote(since)}"
+    )
+
+    changed_reports: dict[str, dict[str, Any]] = {}
+    # Number of changed reports according to Gitea, when it's not known pages are listed until one is empty.
+    total_count: int | None = None
+    page = 1
+    while (total_count is None) or (len(changed_reports) < total_count):
+        if page > len(cached_reports):
+            # Checking each cached report separately takes fewer requests.
+            return
+
+        response = url_response_get(f"{url}&page={page}", {})
+        if response is None:
+            return
+
+        _status, response_headers, result_bytes = response
+        reports = json.loads(result_bytes)
+        if len(reports) == 0:
+            if total_count is not None:
+                # Fewer reports were listed than counted (reports changed while listing them),
+                # so it's unknown if all changed reports were found.
+                return
+            break
+
+        if (page == 1) and ((total_count_header := response_headers.get("X-Total-Count")) is not None):
+            total_count = int(total_count_header)
+            # Use the number of reports Gitea actually returned per page,
+            # it may return fewer than requested (limited by its `MAX_RESPONSE_ITEMS` setting).
+            if math.ceil(total_count / len(reports)) > len(cached_reports):
+                # Checking each cached report separately takes fewer requests.
+                return
+
+        for report in reports:
+            changed_reports[str(report['number'])] = report_information_create(report, None)
+
+        page += 1
+
+    for report_number, report_information in changed_reports.items():
+        if report_number in cached_reports:
+            cached_reports[report_number] = report_information
+    up_to_date_reports.update(cached_reports)
+
+
+def cached_reports_store() -> None:
+    if first_response_date is None:
+        # Nothing was requested from Gitea, the cached reports are unchanged.
+        return
+
+    # Only store reports that were checked in this run, so they are all up to date as of the same date.
+    # Sort them, as the order of the set varies between runs, which would prevent skipping an unchanged file.
+    data_to_cache = {
+        'checked_date': first_response_date,
+        'reports': {report_number: cached_reports[report_number] for report_number in sorted(up_to_date_reports)},
+    }
+    json_file_store(PATH_TO_CACHED_REPORTS, data_to_cache)
+
+
+class Cache:
+    # Loads the cache files when entered and stores them when exited, does nothing when disabled.
+    __slots__ = (
+        "enabled",
+        "refresh_reports",
+        "commits",
+        "reports_checked_date",
+        "commits_to_store",
+    )
+
+    def __init__(self, *, enabled: bool, refresh_reports: bool) -> None:
+        self.enabled = enabled
+        self.refresh_reports = refresh_reports
+        # Cached commit information, keyed by the commit hash.
+        self.commits: dict[str, dict[str, Any]] = {}
+        # The date the cached reports were last checked with Gitea, None when they must not be trusted.
+        self.reports_checked_date: str | None = None
+        # Set once the commits are classified, so commits are not stored when classifying was interrupted.
+        self.commits_to_store: list[CommitInfo] | None = None
+
+    def __enter__(self) -> "Cache":
+        if self.enabled:
+            self.commits = cached_commits_load()
+            if not self.refresh_reports:
+                self.reports_checked_date = cached_reports_load()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if not self.enabled:
+            return
+
+        # Store reports even if classifying was interrupted, so the next run doesn't need to download them again.
+        cached_reports_store()
+
+        if self.commits_to_store is not None:
+            cached_commits_store(self.commits_to_store)
 
 
 # -----------------------------------------------------------------------------
@@ -838,31 +1227,45 @@ def cached_commits_store(list_of_commits: list[CommitInfo]) -> None:
 def overrides_load() -> dict[str, list[str]]:
     override_data = {}
     if PATH_TO_OVERRIDES.exists():
-        with open(str(PATH_TO_OVERRIDES), 'r', encoding='utf-8') as file:
-            override_data = json.load(file)
+        override_data = json_file_load(PATH_TO_OVERRIDES)
 
     return override_data
 
 
 def overrides_store(override_data: dict[str, list[str]]) -> None:
-    with open(str(PATH_TO_OVERRIDES), 'w', encoding='utf-8') as file:
-        json.dump(override_data, file, indent=4)
+    # Overrides may be edited by hand, keep them readable.
+    json_file_store(PATH_TO_OVERRIDES, override_data, indent=4)
 
 
 def overrides_apply(list_of_commits: list[CommitInfo]) -> None:
     override_data = overrides_load()
-    if len(override_data) > 0:
-        for commit in list_of_commits:
-            if commit.hash in override_data:
-                commit.read_from_override(override_data[commit.hash])
+    if len(override_data) == 0:
+        return
 
+    # Overrides are typically few compared to the commits, so look up the commit of each override
+    # rather than looking up every commit in the overrides.
+    commits_by_hash = {commit.hash: commit for commit in list_of_commits}
+    for commit_hash, data in override_data.items():
+        if (commit := commits_by_hash.get(commit_hash)) is not None:
+            commit.read_from_override(data)
 
-def create_override() -> None:
-    commit_hash = input("Please input the full hash of the commit you want to override: ")
-    issue_number = input("Please input the issue number you want to override it with: ")
 
+def create_override() -> None:
+    # Several overrides can be created at once, they are all stored when the user is done.
     override_data = overrides_load()
-    override_data[commit_hash] = [issue_number]
+
+    while True:
+        try:
+            commit_hash = input(
+                "Please input the full hash of the commit you want to override (leave empty when done): "
+            ).strip()
+            if not commit_hash:
+                break
+            issue_number = input("Please input the issue number you want to override it with: ")
+        except EOFError:
+            break
+
+        override_data[commit_hash] = [issue_number]
 
     overrides_store(override_data)
 
@@ -881,7 +1284,7 @@ def argparse_create() -> argparse.ArgumentParser:
         "--override",
         action="store_true",
         help=(
-            "Create a override for a commit."
+            "Create overrides for commits."
         ),
     )
     parser.add_argument(
@@ -889,7 +1292,7 @@ def argparse_create() -> argparse.ArgumentParser:
         "--single-thread",
         action="store_true",
         help=(
-            "Run one of the parts of this script in single threaded mode "
+            "Classify commits one at a time instead of querying Gitea from multiple threads "
             "(Only really useful for debugging)."
         ),
     )
@@ -903,6 +1306,16 @@ def argparse_create() -> argparse.ArgumentParser:
         ),
     )
 
+    parser.add_argument(
+        "-rr",
+        "--refresh-reports",
+        action="store_true",
+        help=(
+            "Ignore the reports stored in the cache and download them again "
+            "(Only has an effect when using the cache)."
+        ),
+    )
+
     parser.add_argument(
         "-cv",
         "--current-version",
@@ -956,6 +1369,15 @@ def argparse_create() -> argparse.ArgumentParser:
     return parser
 
 
+# Arguments the script can't run without: (attribute, name, short argument, long argument).
+REQUIRED_ARGUMENTS = (
+    ("current_version", "Current version", "-cv", "--current-version"),
+    ("previous_version", "Previous version", "-pv", "--previous-version"),
+    ("current_release_tag", "Current Release Tag", "-ct", "--current-release-tag"),
+    ("previous_release_tag", "Previous Release Tag", "-pt", "--previous-release-tag"),
+)
+
+
 def validate_arguments(args: argparse.Namespace) -> bool:
     def print_error(variable_name: str, argument_1: str, argument_2: str) -> None:
         print(f"ERROR: {variable_name} (defined with '{argument_1}' or '{argument_2}') is not defined.")
@@ -965,18 +1387,10 @@ def validate_arguments(args: argparse.Namespace) -> bool:
     if args.cache and not args.silence:
         print("WARNING: You are using a cache, this may lead to outdated information on some commits.")
         print("Do not use the cache to generate the final release notes.\n")
-    if args.current_version is None:
-        print_error("Current version", "-cv", "--current-version")
-        should_quit = True
-    if args.previous_version is None:
-        print_error("Previous version", "-pv", "--previous-version")
-        should_quit = True
-    if args.current_release_tag is None:
-        print_error("Current Release Tag", "-ct", "--current-release-tag")
-        should_quit = True
-    if args.previous_release_tag is None:
-        print_error("Previous Release Tag", "-pt", "--previous-release-tag")
-        should_quit = True
+    for attribute, variable_name, argument_1, argument_2 in REQUIRED_ARGUMENTS:
+        if getattr(args, attribute) is None:
+            print_error(variable_name, argument_1, argument_2)
+            should_quit = True
     if len(args.backport_tasks) == 0:
         print("WARNING: (Optional) -bpt/--backport-tasks is not defined.")
         if not (args.silence or should_quit):
@@ -992,6 +1406,11 @@ def validate_arguments(args: argparse.Namespace) -> bool:
 
 
 def main() -> int:
+    # Creating an override takes no other arguments, skip creating the argument parser for it.
+    if sys.argv[1:] in (["-o"], ["--override"]):
+        create_override()
+        return 0
+
     args = argparse_create().parse_args()
 
     if args.override:
@@ -1001,26 +1420,27 @@ def main() -> int:
     if not validate_arguments(args):
         return 0
 
-    list_of_commits = get_fix_commits(
-        current_release_tag=args.current_release_tag,
-        previous_release_tag=args.previous_release_tag,
-        single_thread=args.single_thread,
-    )
-
-    if args.cache:
-        cached_commits_load(list_of_commits)
+    with Cache(enabled=args.cache, refresh_reports=args.refresh_reports) as cache:
+        # Cached commits are applied while gathering commits.
+        list_of_commits = get_fix_commits(
+            current_release_tag=args.current_release_tag,
+            previous_release_tag=args.previous_release_tag,
+            cached_commits=cache.commits,
+        )
 
-    overrides_apply(list_of_commits)
+        overrides_apply(list_of_commits)
 
-    classify_commits(
-        args.backport_tasks,
-        list_of_commits,
-        current_version=args.current_version,
-        previous_version=args.previous_version,
-    )
+        if cache.reports_checked_date is not None:
+            cached_reports_refresh(cache.reports_checked_date)
 
-    if args.cache:
-        cached_commits_store(list_of_commits)
+        classify_commits(
+            args.backport_tasks,
+            list_of_commits,
+            current_version=args.current_version,
+            previous_version=args.previous_version,
+            single_thread=args.single_thread,
+        )
+        cache.commits_to_store = list_of_commits
 
     print_release_notes(list_of_commits)
     return 0